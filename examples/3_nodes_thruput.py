@@ -106,13 +106,9 @@ def run_simulation(seed: int, args: Args, t_cohere: float) -> Stats:
     return stats
 
 
-def run_row(args: Args, t_cohere: float) -> list[Stats]:
-    results: list[Stats] = []
-    for i in range(args.runs):
-        print(f"T_cohere={t_cohere:.4f}, run {i + 1}")
-        stats = run_simulation(SEED_BASE + i, args, t_cohere)
-        results.append(stats)
-    return results
+def run_one(args: Args, t_cohere: float, i: int) -> Stats:
+    print(f"T_cohere={t_cohere:.4f}, run {i + 1}")
+    return run_simulation(SEED_BASE + i, args, t_cohere)
 
 
 def plot(df: pd.DataFrame, *, save_plt: str):
@@ -142,8 +138,10 @@ if __name__ == "__main__":
     freeze_support()
     args = Args().parse_args()
 
+    # Each (t_cohere, run) pair is an independent job, so that workers stay busy even with few t_cohere values.
     with Pool(processes=args.workers) as pool:
-        rows = pool.starmap(run_row, itertools.product([args], args.t_cohere))
+        flat = pool.starmap(run_one, itertools.product([args], args.t_cohere, range(args.runs)))
+    rows = [flat[i * args.runs : (i + 1) * args.runs] for i in range(len(args.t_cohere))]
 
     if args.json:
         with open(args.json, "w") as file:
@@ -157,9 +155,8 @@ if __name__ == "__main__":
         results["Std Rate"].append(np.std(rates))
 
     # Final results summary print
-    print("\nT_coh    Rate")
-    for t, mean, std in zip(results["T_cohere"], results["Mean Rate"], results["Std Rate"]):
-        print(f"{t:<7.3f}  {mean:>5.1f} ({std:.1f})")
+    summary = zip(results["T_cohere"], results["Mean Rate"], results["Std Rate"])
+    print("\nT_coh    Rate\n" + "\n".join(f"{t:<7.3f}  {mean:>5.1f} ({std:.1f})" for t, mean, std in summary))
 
     df = pd.DataFrame(results)
     if args.csv:
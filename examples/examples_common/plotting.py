@@ -3,9 +3,6 @@ from collections.abc import Mapping, Sequence
 from typing import cast, overload
 
 import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure, SubFigure
 
 want_transparent = os.getenv("MQNS_PLTTRANSPARENT", "1") != "0"
 """
@@ -21,6 +18,14 @@ Default is yes.
 Disable the display window with MQNS_PLTSHOW=0 environment variable.
 """
 
+if not want_show:
+    # Non-interactive backend avoids GUI toolkit initialization when figures are only saved to files.
+    mpl.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.axes import Axes  # noqa: E402
+from matplotlib.figure import Figure, SubFigure  # noqa: E402
+
 type Axes1D = Sequence[Axes]
 """
 1-dimensional array of Axes.
@@ -355,9 +355,7 @@ if __name__ == "__main__":
             swap=SWAP,
             channel_capacity=CHANNEL_CAPACITY,
         )
-        print("Single-run metrics:")
-        for k, v in metrics.items():
-            print(f"  {k}: {v}")
+        print("Single-run metrics:\n" + "\n".join(f"  {k}: {v}" for k, v in metrics.items()))
 
         rows = [{"t_cohere": T_COHERE, "swap": str(SWAP), "channel_capacity": str(CHANNEL_CAPACITY), **metrics}]
         save_results(rows, save_csv=args.csv, save_json=args.json, save_plt=args.plt)
@@ -39,6 +39,7 @@ and then use ``--vora_load`` flag to load the new data file containing vora swap
 """
 
 import copy
+import functools
 import itertools
 import json
 import os.path
@@ -85,6 +86,19 @@ For each distance proportion, function to generate relative weights of qchannel
 """
 
 
+@functools.cache
+def compute_distances(total_distance: float, n_segments: int, distance_proportion: str) -> tuple[float, ...]:
+    """
+    Compute qchannel lengths that add up to ``total_distance``.
+
+    The result is cached because every (routers, proportion, swap, seed) combination rebuilds the same topologies.
+    Plain Python floats are used, as NumPy call overhead dominates for a handful of segments.
+    """
+    weights = DISTANCE_PROPORTION_WEIGHTS[distance_proportion](n_segments)
+    sum_weight = sum(weights)
+    return tuple(total_distance * w / sum_weight for w in weights)
+
+
 class ParameterSet:
     def __init__(self):
         self.seed_base = 100
@@ -130,10 +144,7 @@ class ParameterSet:
         )
 
     def compute_distances(self) -> list[float]:
-        n_segments = self.number_of_routers + 1
-        weights = DISTANCE_PROPORTION_WEIGHTS[self.distance_proportion](n_segments)
-        sum_weight = sum(weights)
-        return [self.total_distance * w / sum_weight for w in weights]
+        return list(compute_distances(self.total_distance, self.number_of_routers + 1, self.distance_proportion))
 
     def to_linear_attempts_csv_filename(self, train_qchannel_capacity=1) -> str:
         return f"{self.number_of_routers}-{self.distance_proportion}-{train_qchannel_capacity}.csv"
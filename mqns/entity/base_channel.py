@@ -1,8 +1,9 @@
+import functools
 from typing import TypedDict, Unpack, override
 
 from mqns.entity.entity import Entity
 from mqns.entity.node import Node
-from mqns.models.delay import DelayInput, parse_delay
+from mqns.models.delay import ConstantDelayModel, DelayInput, parse_delay
 from mqns.simulator import Simulator, Time
 from mqns.utils import log, rng
 
@@ -60,8 +61,10 @@ class BaseChannel[N: Node](Entity):
     def install(self, simulator: Simulator) -> None:
         super().install(simulator)
         self._next_send_time = simulator.ts
+        self._const_delay = simulator.time(sec=self.delay.calculate()) if type(self.delay) is ConstantDelayModel else None
+        """Propagation delay converted to Time, if it is constant."""
 
-    def _send(self, *, packet_repr: str, packet_len: int, next_hop: N) -> tuple[bool, Time]:
+    def _send(self, *, packet_kind: str, packet: object, packet_len: int, next_hop: N) -> tuple[bool, Time]:
         now = self.simulator.tc
 
         if next_hop not in self.node_list:
@@ -72,7 +75,7 @@ class BaseChannel[N: Node](Entity):
 
             if self.max_buffer_size != 0 and send_time > now + self.max_buffer_size / self.bandwidth:
                 # buffer is overflow
-                log.debug(f"{self}: drop {packet_repr} due to overflow")
+                log.debug("%s: drop %s %s due to overflow", self, packet_kind, packet)
                 return True, Time.SENTINEL
 
             self._next_send_time = send_time + packet_len / self.bandwidth
@@ -81,11 +84,11 @@ class BaseChannel[N: Node](Entity):
 
         # random drop
         if self.drop_rate > 0 and rng.random() < self.drop_rate:
-            log.debug(f"{self}: drop {packet_repr} due to drop rate")
+            log.debug("%s: drop %s %s due to drop rate", self, packet_kind, packet)
             return True, Time.SENTINEL
 
         # add delay
-        recv_time = send_time + self.delay.calculate()
+        recv_time = send_time + (self.delay.calculate() if self._const_delay is None else self._const_delay)
         return False, recv_time
 
     def find_peer(self, own: N) -> N:
@@ -108,10 +111,14 @@ class NextHopNotConnectionException(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=256)
 def calc_transmission_prob(length: float, alpha: float) -> float:
     """
     Compute fiber transmission probability (Beer-Lambert Law).
 
+    Recent results are memoized: a topology only has a handful of distinct (length, alpha) pairs,
+    but every network rebuild in a parameter sweep asks for them again.
+
     Args:
         length: fiber length in km.
         alpha: attenuation loss in dB/km.
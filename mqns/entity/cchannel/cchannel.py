@@ -32,6 +32,8 @@ from mqns.entity.base_channel import BaseChannel, BaseChannelInitKwargs
 from mqns.entity.node import Node
 from mqns.simulator import Event, Time
 
+_NOT_DECODED = object()
+
 
 class ClassicPacket:
     """ClassicPacket is the message that transfer on a ClassicChannel"""
@@ -46,6 +48,7 @@ class ClassicPacket:
 
         """
         self.is_json, self.msg = (False, msg) if isinstance(msg, (str, bytes)) else (True, json.dumps(msg))
+        self._decoded: Any = _NOT_DECODED
         self.src = src
         self.dest = dest
 
@@ -57,8 +60,18 @@ class ClassicPacket:
         return self.msg
 
     def get(self) -> Any:
-        """Get the message from packet."""
-        return json.loads(self.msg) if self.is_json else self.msg
+        """
+        Get the message from packet.
+
+        JSON content is decoded on first access and the same object is returned afterwards,
+        so that every application on the receiving node can inspect the message without re-parsing.
+        Callers must not modify the returned message.
+        """
+        if not self.is_json:
+            return self.msg
+        if self._decoded is _NOT_DECODED:
+            self._decoded = json.loads(self.msg)
+        return self._decoded
 
     def __len__(self) -> int:
         return len(self.msg)
@@ -89,7 +102,8 @@ class ClassicChannel(BaseChannel[Node]):
 
         """
         drop, recv_time = self._send(
-            packet_repr=f"packet {packet}",
+            packet_kind="packet",
+            packet=packet,
             packet_len=len(packet),
             next_hop=next_hop,
         )
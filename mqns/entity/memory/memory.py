@@ -28,7 +28,7 @@
 import heapq
 import itertools
 from collections.abc import Callable, Iterable, Iterator
-from typing import Any, Literal, TypedDict, Unpack, overload, override
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, Unpack, overload, override
 
 from mqns.entity.entity import Entity
 from mqns.entity.memory.event import (
@@ -46,6 +46,9 @@ from mqns.models.epr import Entanglement
 from mqns.models.error import TimeDecayInput, parse_time_decay
 from mqns.simulator import Event, Simulator
 
+if TYPE_CHECKING:
+    from mqns.network.protocol.event import QubitDecoheredEvent
+
 
 class QuantumMemoryInitKwargs(TypedDict, total=False):
     """QuantumMemory constructor parameters."""
@@ -109,9 +112,18 @@ class QuantumMemory(Entity):
         Value is a sorted list of qubit addrs.
         """
 
+        self._by_name = dict[str, int]()
+        """
+        Mapping from name of stored data to qubit addr.
+        EPR names are unique, so each name identifies at most one qubit.
+        """
+
     @override
     def install(self, simulator: Simulator) -> None:
+        from mqns.network.protocol.event import QubitDecoheredEvent  # noqa: PLC0415
+
         super().install(simulator)
+        self._decohered_event_type: type["QubitDecoheredEvent"] = QubitDecoheredEvent
 
         self.t_decohere = simulator.time(sec=self._t_cohere)
         """
@@ -345,7 +357,8 @@ class QuantumMemory(Entity):
         if type(key) is int:
             qubit, data = self._storage[key]
         else:
-            qubit, data = next(self.find(lambda _, v: getattr(v, "name", None) == key), (None, None))
+            addr = self._by_name.get(key)
+            qubit, data = (None, None) if addr is None else self._storage[addr]
 
         if qubit is None:
             if must or has:
@@ -362,6 +375,7 @@ class QuantumMemory(Entity):
             qubit.set_event(QuantumMemory, None)  # cancel scheduled decoherence event
             self._usage -= 1
             self._storage[qubit.addr] = (qubit, None)
+            self._update_name_index(qubit.addr, data, None)
 
         return qubit, data
 
@@ -396,6 +410,7 @@ class QuantumMemory(Entity):
             raise ValueError(f"qubit contains existing data: {old}")
 
         self._storage[qubit.addr] = (qubit, data)
+        self._update_name_index(qubit.addr, old, data)
         if old is None:
             self._usage += 1
 
@@ -412,13 +427,20 @@ class QuantumMemory(Entity):
             qubit.reset_state()
             self._storage[qubit.addr] = (qubit, None)
         self._usage = 0
+        self._by_name.clear()
 
-    def _schedule_decohere(self, qubit: MemoryQubit, epr: Entanglement):
-        from mqns.network.protocol.event import QubitDecoheredEvent  # noqa: PLC0415
+    def _update_name_index(self, addr: int, old: QuantumModel | None, new: QuantumModel | None) -> None:
+        old_name = getattr(old, "name", None)
+        if old_name is not None and self._by_name.get(old_name) == addr:
+            del self._by_name[old_name]
+        new_name = getattr(new, "name", None)
+        if new_name is not None:
+            self._by_name.setdefault(new_name, addr)
 
+    def _schedule_decohere(self, qubit: MemoryQubit, epr: Entanglement):
         assert epr.decohere_time >= self.simulator.tc
 
-        event = QubitDecoheredEvent(self, qubit, epr, t=epr.decohere_time)
+        event = self._decohered_event_type(self, qubit, epr, t=epr.decohere_time)
         qubit.set_event(QuantumMemory, event)
         self.simulator.add_event(event)
 
@@ -58,6 +58,8 @@ class Monitor(Entity):
         self.network = network
         self.attributions: list[tuple[str, AttributionFunc]] = []
         self.records: dict[str, list[Any]] = {"time": []}
+        self._columns: list[tuple[list[Any], AttributionFunc]] = []
+        """Record column and calculate function of each attribution, pre-bound to skip per-event dict lookups."""
 
         self.watch_at_start = False
         self.watch_at_finish = False
@@ -84,9 +86,10 @@ class Monitor(Entity):
 
     @override
     def handle(self, event: Event) -> None:
-        self.records["time"].append(self.simulator.tc.sec)
-        for name, calculate_func in self.attributions:
-            self.records[name].append(calculate_func(self.simulator, self.network, event))
+        simulator, network = self.simulator, self.network
+        self.records["time"].append(simulator.tc.sec)
+        for column, calculate_func in self._columns:
+            column.append(calculate_func(simulator, network, event))
 
         if isinstance(event, MonitorEvent) and event.period is not None:
             event.t += event.period
@@ -120,7 +123,8 @@ class Monitor(Entity):
         """
         self.ensure_not_installed()
         self.attributions.append((name, calculate_func))
-        self.records[name] = []
+        column = self.records[name] = []
+        self._columns.append((column, calculate_func))
 
     def at_start(self) -> None:
         """
@@ -168,3 +172,26 @@ class Monitor(Entity):
         """
         self.ensure_not_installed()
         self.watch_event.append(event_type)
+
+    def stop_watch_event(self) -> None:
+        """
+        Stop watching events registered with ``at_event``.
+
+        This may be invoked from an attribution function, e.g. once a target count is reached,
+        so that subsequent events no longer pay for the monitor.
+        Start, finish, and periodic watches are unaffected.
+        """
+        watchers = self.simulator.watchers
+        if watchers is None:
+            return
+
+        for event_type in self.watch_event:
+            # replace rather than mutate the list, in case the simulator is iterating over it
+            monitors = [m for m in watchers.get(event_type, []) if m is not self]
+            if monitors:
+                watchers[event_type] = monitors
+            else:
+                watchers.pop(event_type, None)
+
+        if not watchers:
+            self.simulator.watchers = None
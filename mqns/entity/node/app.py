@@ -70,7 +70,7 @@ class Application[N: "Node"](ABC):
         return self._dispatch(event)
 
     def _dispatch(self, event: Event) -> bool:
-        for handler in self._dispatch_table.get(type(event), []):
+        for handler in self._dispatch_table.get(type(event), ()):
             skip = handler(event)
             if skip is True:
                 return skip
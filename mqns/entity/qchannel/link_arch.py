@@ -86,6 +86,8 @@ class LinkArch(Protocol):
     the skip-ahead sampling implementation in ``LinkLayer`` application.
     """
 
+    __slots__ = ()
+
     name: str
     """Link architecture name."""
 
@@ -141,18 +143,49 @@ class LinkArch(Protocol):
         ...
 
 
+def _error_model_state(v: object) -> object:
+    """
+    Capture error model parameters for comparison in ``LinkArchBase.set()`` memo.
+    Enclosed error models, such as those in ``ChainErrorModel``, are captured recursively.
+    """
+    if isinstance(v, ErrorModel):
+        return type(v), {k: _error_model_state(x) for k, x in vars(v).items()}
+    if isinstance(v, list):
+        return [_error_model_state(x) for x in v]
+    return v
+
+
 class LinkArchBase(ABC, LinkArch):
+    __slots__ = ("name", "success_prob", "attempt_interval", "d_notify_a", "d_notify_b", "_set_memo", "_make_epr")
+
     def __init__(self, name: str):
         self.name = name
         self.success_prob = 0.0
         self.attempt_interval = 0.0
         self.d_notify_a = 0.0
         self.d_notify_b = 0.0
+        self._set_memo: tuple | None = None
 
     @override
     def set(self, **kwargs: Unpack[LinkArchParameters]) -> None:
         ch = kwargs["ch"]
         tau_l = ch.delay.calculate()
+
+        # LinkLayer calls set() whenever a qchannel is (re-)activated, normally with the same parameters.
+        # In that case, keep the previously computed values and skip the mini simulation.
+        # Only the accuracy of t0 is relevant.
+        # The transfer error model is captured by value, because it may be modified in place.
+        memo = (
+            ch.length,
+            ch.alpha,
+            tau_l,
+            _error_model_state(ch.transfer_error),
+            kwargs.get("t0", Time.SENTINEL).accuracy,
+            {k: v for k, v in kwargs.items() if k != "t0"},
+        )
+        if memo == self._set_memo:
+            return
+
         for _ in range(16):
             assert ch.delay.calculate() == tau_l, "QuantumChannel.delay must be constant"
 
@@ -182,18 +215,22 @@ class LinkArchBase(ABC, LinkArch):
 
             self._make_epr = _make_epr_with_init_fidelity
 
+        self._set_memo = memo
+
     @abstractmethod
     def _compute_success_prob(self, *, length: float, alpha: float, eta_s: float, eta_d: float) -> float:
         """
         Compute success probability of a single attempt.
-        Subclass implementation may precompute or save other parameters if necessary.
+        Subclass implementation may precompute or save other parameters if necessary;
+        attributes used to save them must be declared in the subclass ``__slots__``.
         """
 
     @abstractmethod
     def _compute_delays(self, *, reset_time: float, tau_l: float, tau_0: float) -> tuple[float, float, float]:
         """
         Compute attempt interval and notification delays, for protocol delay computation.
-        Subclass implementation may precompute or save other parameters if necessary.
+        Subclass implementation may precompute or save other parameters if necessary;
+        attributes used to save them must be declared in the subclass ``__slots__``.
         Override ``delays()`` method for unusual situations.
         """
 
@@ -308,6 +345,8 @@ class LinkArchAlways(LinkArch):
     Link architecture wrapper that always succeeds, primarily for unit testing.
     """
 
+    __slots__ = ("name", "inner", "success_prob")
+
     def __init__(self, inner: LinkArch):
         self.name = f"{inner.name}-always"
         self.inner = inner
@@ -12,6 +12,8 @@ class LinkArchDimBk(LinkArchBase):
     Detection-in-Midpoint link architecture with single-rail encoding using Barrett-Kok protocol.
     """
 
+    __slots__ = ()
+
     def __init__(self, name="DIM-BK"):
         super().__init__(name)
 
@@ -92,6 +94,8 @@ class LinkArchDimBkSeq(LinkArchDimBk):
     timing adjusted as per negotiation logic implemented by SeQUeNCe simulator.
     """
 
+    __slots__ = ()
+
     def __init__(self, name="DIM-BK-SeQUeNCe"):
         super().__init__(name)
 
@@ -128,6 +132,8 @@ class LinkArchDimDual(LinkArchBase):
     Detection-in-Midpoint link architecture with dual-rail polarization encoding.
     """
 
+    __slots__ = ()
+
     def __init__(self, name="DIM-dual"):
         super().__init__(name)
 
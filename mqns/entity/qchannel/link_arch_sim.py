@@ -14,6 +14,8 @@ class LinkArchSim(LinkArchBase):
     The receiver is modeled as direct absorption: when a photon hits its detector, the memory captures its state.
     """
 
+    __slots__ = ()
+
     def __init__(self, name="SIM"):
         super().__init__(name)
 
@@ -26,7 +26,7 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import hashlib
-import uuid
+import itertools
 from abc import abstractmethod
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Self, TypedDict, Unpack, cast
@@ -45,6 +45,9 @@ from mqns.utils import rng
 if TYPE_CHECKING:
     from mqns.entity.node import QNode
 
+_name_seq = itertools.count()
+"""Sequence for default entanglement names."""
+
 
 class EntanglementInitKwargs(TypedDict, total=False):
     name: str | None
@@ -63,7 +66,7 @@ class Entanglement(QuantumModel):
         Constructor.
 
         Args:
-            name: Entanglement name, defaults to a random string.
+            name: Entanglement name, defaults to a unique string.
             decohere_time: EPR decoherence time point, defaults to ``Time.SENTINEL``.
             fidelity_time: EPR creation or fidelity update time point, defaults to ``Time.SENTINEL``.
             src: Left node that holds one of the entangled qubits.
@@ -71,7 +74,7 @@ class Entanglement(QuantumModel):
             store_decays: Memory time-based decay functions at src and dst.
         """
         name = kwargs.get("name")
-        self.name = uuid.uuid4().hex if name is None else name
+        self.name = f"{next(_name_seq):x}" if name is None else name
         """Descriptive name."""
 
         self.is_decoherenced = False
@@ -194,7 +197,7 @@ class Entanglement(QuantumModel):
                 orig_eprs.extend(cast(list[E], epr.orig_eprs))
 
         orig_names = "-".join((e.name for e in orig_eprs))
-        name = hashlib.sha256(orig_names.encode()).hexdigest()[:32]  # same length as `uuid.uuid4().hex`
+        name = hashlib.sha256(orig_names.encode()).hexdigest()[:32]
         ne = cast(
             E,
             type(epr0)._make_swapped(
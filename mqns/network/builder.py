@@ -539,6 +539,10 @@ class NetworkBuilder:
         """
         Construct quantum network.
 
+        QNode applications are copied from their prototypes, but the controller applications and the routing
+        algorithm are used as-is. Therefore, this method should be called at most once per builder;
+        for repeated runs (e.g., a seed sweep), construct a new ``NetworkBuilder`` each time.
+
         Args:
             topo: Result of ``.make_topo()`` method with possible modification, defaults to ``self.make_topo()``.
             connect_controller: If True and controller exists, create cchannels between controller and each qnode.
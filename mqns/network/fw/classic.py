@@ -19,7 +19,7 @@ def fw_control_cmd_handler(cmd: str):
     def decorator(f: Callable[[Any, Any], Any]):
         @functools.wraps(f)
         def wrapper(self: "ForwarderClassicMixin", pkt: ClassicPacket, msg: dict):
-            log.debug(f"{self.node}: received control message from {pkt.src} | {msg}")
+            log.debug("%s: received control message from %s | %s", self.node, pkt.src, msg)
             f(self, msg)
             return True
 
@@ -42,14 +42,14 @@ def fw_signaling_cmd_handler(cmd: str):
             try:
                 fib_entry = self.fib.get(path_id)
             except IndexError:
-                log.debug(f"{self.node}: dropping signaling message from {pkt.src}, reason=no-fib-entry | {msg}")
+                log.debug("%s: dropping signaling message from %s, reason=no-fib-entry | %s", self.node, pkt.src, msg)
                 return True
 
             if pkt.dest != self.node:
-                self.send_msg(pkt.dest, msg, fib_entry, forward=True)
+                self.send_msg(pkt.dest, msg, fib_entry, forward=pkt)
                 return True
 
-            log.debug(f"{self.node}: received signaling message from {pkt.src} | {msg}")
+            log.debug("%s: received signaling message from %s | %s", self.node, pkt.src, msg)
             f(self, msg, fib_entry)
             return True
 
@@ -78,19 +78,26 @@ class ForwarderClassicMixin(ClassicCommandDispatcherMixin):
 
     def send_ctrl(self, msg: Mapping):
         ctrl = self.network.get_controller()
-        log.debug(f"{self.node}: sending control message to controller | {msg}")
+        log.debug("%s: sending control message to controller | %s", self.node, msg)
         self.node.send_cpacket(ctrl, ClassicPacket(msg, src=self.node, dest=ctrl))
 
-    def send_msg(self, dest: Node, msg: Mapping, fib_entry: FibEntry, *, forward=False):
+    def send_msg(self, dest: Node, msg: Mapping, fib_entry: FibEntry, *, forward: ClassicPacket | None = None):
         """
         Send/forward a signaling message along the path specified in FIB entry.
+
+        Args:
+            forward: When forwarding, the received packet, which is passed on as is so that the message is not re-encoded.
         """
-        dest_idx = fib_entry.route.index(dest.name)
+        dest_idx = fib_entry.route_index[dest.name]
         nh = fib_entry.route[fib_entry.own_idx + 1] if dest_idx > fib_entry.own_idx else fib_entry.route[fib_entry.own_idx - 1]
         next_hop = self.network.get_node(nh)
 
         log.debug(
-            f"{self.node}: {'forwarding' if forward else 'sending'} signaling message to {dest.name} via {next_hop.name}"
-            f" | {msg}"
+            "%s: %s signaling message to %s via %s | %s",
+            self.node,
+            "sending" if forward is None else "forwarding",
+            dest.name,
+            next_hop.name,
+            msg,
         )
-        self.node.send_cpacket(next_hop, ClassicPacket(msg, src=self.node, dest=dest))
+        self.node.send_cpacket(next_hop, ClassicPacket(msg, src=self.node, dest=dest) if forward is None else forward)
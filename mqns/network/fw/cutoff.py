@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from array import array
 from typing import TYPE_CHECKING, override
 
 from mqns.entity.memory import MemoryQubit
@@ -126,13 +127,15 @@ class CutoffScheme(ABC):
 
 
 class CutoffSchemeWaitTimeCounters:
+    __slots__ = ("wait_values",)
+
     def __init__(self):
-        self.wait_values: list[int] | None = None
+        self.wait_values: array[int] | None = None
         """wait time values for waited qubits before swap, in time_slots"""
 
     def enable_collect_all(self) -> None:
         """Enable collecting all values for histogram generation."""
-        self.wait_values = []
+        self.wait_values = array("q")
 
 
 class CutoffSchemeWaitTime(CutoffScheme):
@@ -16,7 +16,7 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from collections.abc import Callable, Iterator, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import final
 
 from mqns.network.fw.message import SwapSequence
@@ -24,7 +24,7 @@ from mqns.simulator import Time
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FibEntry:
     path_id: int
     """Path identifier, identifies end-to-end path."""
@@ -40,25 +40,27 @@ class FibEntry:
     """Swap cutoff times."""
     purif: dict[str, int]
     """Purification scheme."""
-
-    @property
-    def own_swap_rank(self) -> int:
-        return self.swap[self.own_idx]
-
-    @property
-    def is_swap_disabled(self) -> bool:
-        """
-        Determine whether swapping has been disabled.
-
-        To disable swapping, set swap_sequence to a list of zeros.
-
-        When swapping is disabled, the forwarder will consume entanglement upon completing purification,
-        without attempting entanglement swapping.
-
-        Args:
-            fib_entry: a FIB entry.
-        """
-        return self.swap[0] == 0 == self.swap[-1]
+    route_index: dict[str, int] = field(init=False, repr=False, compare=False)
+    """Mapping from node name to its index within the route."""
+    own_swap_rank: int = field(init=False, repr=False, compare=False)
+    """Swapping rank of own node."""
+    is_end_node: bool = field(init=False, repr=False, compare=False)
+    """Whether own node is the source or destination of the path."""
+    is_swap_disabled: bool = field(init=False, repr=False, compare=False)
+    """
+    Whether swapping has been disabled.
+
+    To disable swapping, set swap_sequence to a list of zeros.
+
+    When swapping is disabled, the forwarder will consume entanglement upon completing purification,
+    without attempting entanglement swapping.
+    """
+
+    def __post_init__(self):
+        object.__setattr__(self, "route_index", {node_name: i for i, node_name in enumerate(self.route)})
+        object.__setattr__(self, "own_swap_rank", self.swap[self.own_idx])
+        object.__setattr__(self, "is_end_node", self.own_idx in (0, len(self.route) - 1))
+        object.__setattr__(self, "is_swap_disabled", self.swap[0] == 0 == self.swap[-1])
 
     def find_index_and_swap_rank(self, node_name: str) -> tuple[int, int]:
         """
@@ -75,7 +77,10 @@ class FibEntry:
         Raises:
             IndexError: node does not exist in route.
         """
-        idx = self.route.index(node_name)
+        try:
+            idx = self.route_index[node_name]
+        except KeyError:
+            raise IndexError(f"{node_name} does not exist in route") from None
         return idx, self.swap[idx]
 
 
@@ -130,10 +135,10 @@ class Fib:
         Raises:
             IndexError: Entry not found.
         """
-        try:
-            return self.table[path_id]
-        except KeyError:
+        entry = self.table.get(path_id)
+        if entry is None:
             raise IndexError(f"FIB entry not found for path_id={path_id}")
+        return entry
 
     def insert_or_replace(self, entry: FibEntry):
         """
@@ -155,9 +160,8 @@ class Fib:
 
         Nonexistent entry is silent ignored.
         """
-        try:
-            entry = self.table.pop(path_id)
-        except KeyError:
+        entry = self.table.pop(path_id, None)
+        if entry is None:
             return
 
         rg = self.by_req_id[entry.req_id]
@@ -165,10 +169,17 @@ class Fib:
             del self.by_req_id[entry.req_id]
 
     def list_path_ids_by_request_id(self, request_id: int) -> Set[int]:
+        """
+        List path_ids installed for a request.
+
+        Returns:
+            Read-only view of the path_ids, which reflects later FIB changes.
+            Caller must not modify it; copy it if a stable snapshot is needed.
+        """
         rg = self.by_req_id.get(request_id)
         if rg:
             return rg.path_ids
-        return set()
+        return frozenset()
 
     def find_request(self, predicate: Callable[[FibRequestGroup], bool]) -> Iterator[FibRequestGroup]:
         for rg in self.by_req_id.values():
@@ -17,6 +17,7 @@
 
 import copy
 from abc import abstractmethod
+from array import array
 from typing import TypedDict, Unpack, cast, override
 
 import numpy as np
@@ -59,6 +60,19 @@ class ForwarderInitKwargs(TypedDict, total=False):
 class ForwarderCounters:
     """Counters of ``Forwarder``."""
 
+    __slots__ = (
+        "n_entg",
+        "n_purif",
+        "n_eligible",
+        "n_swapped_s",
+        "n_swapped_p",
+        "n_swap_conflict",
+        "n_consumed",
+        "consumed_sum_fidelity",
+        "consumed_fidelity_values",
+        "n_cutoff",
+    )
+
     def __init__(self):
         self.n_entg = 0
         """How many elementary entanglements received from link layer."""
@@ -76,7 +90,7 @@ class ForwarderCounters:
         """How many entanglements were consumed (either end-to-end or in swap-disabled mode)."""
         self.consumed_sum_fidelity = 0.0
         """Sum of fidelity of consumed entanglement.s"""
-        self.consumed_fidelity_values: list[float] | None = None
+        self.consumed_fidelity_values: array[float] | None = None
         """Fidelity values of consumed entanglements, None disables collection."""
         self.n_cutoff = [0, 0]
         """
@@ -91,7 +105,7 @@ class ForwarderCounters:
     def enable_collect_all(self) -> None:
         """Enable collecting all values for histogram generation."""
         assert self.n_consumed == 0
-        self.consumed_fidelity_values = []
+        self.consumed_fidelity_values = array("d")
 
     def increment_n_purif(self, i: int) -> None:
         if len(self.n_purif) <= i:
@@ -230,7 +244,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         if event.phase is TimingPhase.EXTERNAL:
             self.remote_swapped_eprs.clear()
         elif event.phase is TimingPhase.INTERNAL:
-            log.debug(f"{self.node}: there are {len(self.waiting_etg)} etg qubits to process")
+            log.debug("%s: there are %s etg qubits to process", self.node, len(self.waiting_etg))
             for etg_event in self.waiting_etg:
                 self.qubit_is_entangled(etg_event)
             self.waiting_etg.clear()
@@ -368,7 +382,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         qubit = event.qubit
         assert qubit.state == QubitState.ENTANGLED1
         _, epr = self.memory.read(qubit.addr, has=self.epr_type)
-        log.debug(f"{self.node}: ENTANGLED {qubit} | {epr}")
+        log.debug("%s: ENTANGLED %s | %s", self.node, qubit, epr)
         self.mux.qubit_is_entangled(qubit, epr, event.neighbor)
 
         su_args = self.waiting_su.pop(qubit.addr, None)
@@ -405,8 +419,12 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         segment_name = f"{self.node.name}-{partner.name}" if own_idx < partner_idx else f"{partner.name}-{self.node.name}"
         want_rounds = fib_entry.purif.get(segment_name, 0)
         log.debug(
-            f"{self.node}: segment {segment_name} (qubit {qubit.addr}) has "
-            + f"{qubit.purif_rounds} and needs {want_rounds} purif rounds"
+            "%s: segment %s (qubit %s) has %s and needs %s purif rounds",
+            self.node,
+            segment_name,
+            qubit.addr,
+            qubit.purif_rounds,
+            want_rounds,
         )
 
         if qubit.purif_rounds == want_rounds:
@@ -419,7 +437,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         is_primary = (own_rank, own_idx) < (partner_rank, partner_idx)
         if not is_primary:
-            log.debug(f"{self.node}: is not primary node for segment {segment_name} purif")
+            log.debug("%s: is not primary node for segment %s purif", self.node, segment_name)
             return
 
         candidates = self.memory.find(
@@ -434,7 +452,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         )
         found = call_select_purif_qubit(self._select_purif_qubit, qubit, fib_entry, partner, candidates)
         if not found:
-            log.debug(f"{self.node}: no candidate EPR for segment {segment_name} purif round {1 + qubit.purif_rounds}")
+            log.debug("%s: no candidate EPR for segment %s purif round %s", self.node, segment_name, 1 + qubit.purif_rounds)
             return
 
         self._send_purif_solicit(qubit, found[0], fib_entry, partner)
@@ -454,8 +472,13 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         _, epr1 = self.memory.read(mq1.addr, has=self.epr_type, set_fidelity=True, remove=True)
 
         log.debug(
-            f"{self.node}: request purif qubit {mq0.addr} (F={epr0.fidelity}) and "
-            + f"{mq1.addr} (F={epr1.fidelity}) with partner {partner.name}"
+            "%s: request purif qubit %s (F=%s) and %s (F=%s) with partner %s",
+            self.node,
+            mq0.addr,
+            epr0.fidelity,
+            mq1.addr,
+            epr1.fidelity,
+            partner.name,
         )
 
         mq0.state = QubitState.PENDING
@@ -505,15 +528,26 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         assert msg["partner"] == self.node.name
         primary = self.network.get_node(msg["purif_node"])
         log.debug(
-            f"{self.node}: perform purif qubit {mq0.addr} (F={epr0.fidelity}) and "
-            + f"{mq1.addr} (F={epr1.fidelity}) for round {1 + mq0.purif_rounds} with primary {primary.name}"
+            "%s: perform purif qubit %s (F=%s) and %s (F=%s) for round %s with primary %s",
+            self.node,
+            mq0.addr,
+            epr0.fidelity,
+            mq1.addr,
+            epr1.fidelity,
+            1 + mq0.purif_rounds,
+            primary.name,
         )
 
         # perform purification between EPRs
         result = epr0.purify(epr1, now=self.simulator.tc)
         log.debug(
-            f"{self.node}: purif {'succeeded' if result else 'failed'} on qubit {mq0.addr} (F={epr0.fidelity}) "
-            + f"for round {1 + mq0.purif_rounds} with primary {primary.name}"
+            "%s: purif %s on qubit %s (F=%s) for round %s with primary %s",
+            self.node,
+            "succeeded" if result else "failed",
+            mq0.addr,
+            epr0.fidelity,
+            1 + mq0.purif_rounds,
+            primary.name,
         )
 
         if result:
@@ -562,8 +596,13 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         result = msg["result"]
         log.debug(
-            f"{self.node}: purif {'succeeded' if result else 'failed'} on qubit {qubit.addr} (F={epr.fidelity}) "
-            + f"for round {1 + qubit.purif_rounds} with partner {msg['partner']}"
+            "%s: purif %s on qubit %s (F=%s) for round %s with partner %s",
+            self.node,
+            "succeeded" if result else "failed",
+            qubit.addr,
+            epr.fidelity,
+            1 + qubit.purif_rounds,
+            msg["partner"],
         )
 
         if not result:  # purif failed
@@ -595,7 +634,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         """
         assert qubit.state == QubitState.ELIGIBLE
         if not self.node.timing.is_internal():
-            log.debug(f"{self.node}: INT phase is over -> stop swaps")
+            log.debug("%s: INT phase is over -> stop swaps", self.node)
             return
 
         _, epr = self.memory.read(qubit.addr, has=self.epr_type)
@@ -605,11 +644,13 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         self.cutoff.qubit_is_eligible(qubit, fib_entry)
 
+        # bind locals used by the per-qubit predicate
+        qchannel, filter_swap_candidate = qubit.qchannel, self.cutoff.filter_swap_candidate
         swap_candidates = self.memory.find(
             lambda q, _: (
                 q.state == QubitState.ELIGIBLE  # in ELIGIBLE state
-                and q.qchannel != qubit.qchannel  # assigned to a different channel
-                and self.cutoff.filter_swap_candidate(q)
+                and q.qchannel != qchannel  # assigned to a different channel
+                and filter_swap_candidate(q)
             ),
             has=self.epr_type,
         )
@@ -670,7 +711,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         # Attempt the swap.
         new_epr = Entanglement.swap(prev_epr, next_epr, now=self.simulator.tc, ps=self.ps)
-        log.debug(f"{self.node}: SWAP {'SUCC' if new_epr else 'FAILED'} | {prev_qubit} x {next_qubit} = {new_epr}")
+        log.debug("%s: SWAP %s | %s x %s = %s", self.node, "SUCC" if new_epr else "FAILED", prev_qubit, next_qubit, new_epr)
 
         if new_epr is not None:  # swapping succeeded
             self.cnt.n_swapped_s += 1
@@ -724,12 +765,12 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         """
         if not self.node.timing.is_internal():
-            log.debug(f"{self.node}: INT phase is over -> stop swaps")
+            log.debug("%s: INT phase is over -> stop swaps", self.node)
             return
 
         _, sender_rank = fib_entry.find_index_and_swap_rank(msg["swapping_node"])
         if fib_entry.own_swap_rank < sender_rank:
-            log.debug(f"### {self.node}: VERIFY -> rcvd SU from higher-rank node")
+            log.debug("### %s: VERIFY -> rcvd SU from higher-rank node", self.node)
             return
 
         new_epr_name = msg["new_epr"]
@@ -749,7 +790,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         elif fib_entry.own_swap_rank == sender_rank and epr_name in self.parallel_swappings:
             self._su_parallel(msg, fib_entry, new_epr)
         else:
-            log.debug(f"### {self.node}: EPR {epr_name} decohered during SU transmissions")
+            log.debug("### %s: EPR %s decohered during SU transmissions", self.node, epr_name)
 
     def _su_sequential(
         self,
@@ -772,7 +813,7 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
             or new_epr.decohere_time <= self.simulator.tc  # oldest pair decohered
         ):
             if new_epr:
-                log.debug(f"{self.node}: NEW EPR {new_epr} decohered during SU transmissions")
+                log.debug("%s: NEW EPR %s decohered during SU transmissions", self.node, new_epr)
             # Inform LinkLayer that the memory qubit has been released.
             self.release_qubit(qubit, need_remove=True)
             return
@@ -878,14 +919,14 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
             src, dst = epr.src.name, epr.dst.name
             return next(self.fib.find_request(lambda g: g.src == src and g.dst == dst), None) is not None
 
-        return fib_entry.is_swap_disabled or fib_entry.own_idx in (0, len(fib_entry.route) - 1)
+        return fib_entry.is_swap_disabled or fib_entry.is_end_node
 
     def consume_and_release(self, qubit: MemoryQubit):
         """
         Consume an entangled qubit.
         """
         _, qm = self.memory.read(qubit.addr, has=self.epr_type, set_fidelity=True, remove=True)
-        log.debug(f"{self.node}: consume EPR: {qm}")
+        log.debug("%s: consume EPR: %s", self.node, qm)
         self.cnt.increment_n_consumed(qm.fidelity)
 
         self.release_qubit(qubit)
@@ -79,14 +79,15 @@ class PathInstructions(TypedDict):
 def validate_path_instructions(instructions: PathInstructions) -> None:
     def check_purif_segment(segment_name: str) -> bool:
         try:
-            idx0, idx1 = (route.index(node_name) for node_name in segment_name.split("-"))
+            idx0, idx1 = (route_index[node_name] for node_name in segment_name.split("-"))
             return idx0 < idx1
-        except ValueError:
+        except (KeyError, ValueError):
             return False
 
     route = instructions["route"]
     if len(route) == 0:
         raise ValueError("route is empty")
+    route_index = {node_name: i for i, node_name in enumerate(route)}
 
     if len(instructions["swap"]) != len(route):
         raise ValueError("swapping order does not match route length")
@@ -38,8 +38,12 @@ def intersect_tmp_path_ids(epr0: Entanglement, epr1: Entanglement) -> frozenset[
 class MuxSchemeDynamicBase(MuxScheme):
     def __init__(self, name: str):
         super().__init__(name)
-        self.qchannel_paths_map = defaultdict[str, list[int]](lambda: [])
-        """stores path-qchannel relationship"""
+        self.qchannel_paths_map = defaultdict[QuantumChannel, list[int]](lambda: [])
+        """
+        Stores path-qchannel relationship.
+        Key is qchannel.
+        Value is list of path_ids using the qchannel.
+        """
 
     @override
     def validate_path_instructions(self, instructions: PathInstructions):
@@ -58,7 +62,7 @@ class MuxSchemeDynamicBase(MuxScheme):
         _ = instructions
         _ = direction
         _ = neighbor
-        self.qchannel_paths_map[qchannel.name].append(fib_entry.path_id)
+        self.qchannel_paths_map[qchannel].append(fib_entry.path_id)
 
     @override
     def uninstall_path_neighbor(
@@ -70,10 +74,10 @@ class MuxSchemeDynamicBase(MuxScheme):
     ) -> None:
         _ = direction
         _ = neighbor
-        paths = self.qchannel_paths_map[qchannel.name]
+        paths = self.qchannel_paths_map[qchannel]
         paths.remove(fib_entry.path_id)
         if len(paths) == 0:
-            del self.qchannel_paths_map[qchannel.name]
+            del self.qchannel_paths_map[qchannel]
 
     @override
     def qubit_has_path_id(self) -> bool:
@@ -83,9 +87,9 @@ class MuxSchemeDynamicBase(MuxScheme):
         assert qubit.path_id is None
         assert qubit.qchannel is not None, f"{self.node}: No qubit-qchannel assignment. Not supported."
 
-        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel.name, [])
+        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel, [])
         if not possible_path_ids:
-            log.debug(f"{self.node}: release entangled qubit {qubit.addr} due to uninstalled path")
+            log.debug("%s: release entangled qubit %s due to uninstalled path", self.node, qubit.addr)
             self.fw.release_qubit(qubit, need_remove=True)
 
         return possible_path_ids
@@ -146,7 +150,7 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         if not possible_path_ids:  # all paths on the channel have been uninstalled
             return
 
-        log.debug(f"{self.node}: qubit {qubit} has tmp_path_ids {possible_path_ids}")
+        log.debug("%s: qubit %s has tmp_path_ids %s", self.node, qubit, possible_path_ids)
         if epr.tmp_path_ids is None:
             epr.tmp_path_ids = possible_path_ids
         elif self.coordinated_decisions:
@@ -160,7 +164,7 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
             qubit.state = QubitState.PURIF
 
             # purif scheme is empty, as checked in validate_path_instructions
-            log.debug(f"{self.node}: no FIB associated to qubit -> set eligible")
+            log.debug("%s: no FIB associated to qubit -> set eligible", self.node)
             qubit.state = QubitState.ELIGIBLE
             self.fw.qubit_is_eligible(qubit, None)
 
@@ -186,14 +190,14 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         matched_channels = {
             channel
             for channel, path_ids in self.qchannel_paths_map.items()
-            if channel != qubit.qchannel.name and has_intersect_tmp_path_ids(epr.tmp_path_ids, path_ids)
+            if channel is not qubit.qchannel and has_intersect_tmp_path_ids(epr.tmp_path_ids, path_ids)
         }
 
         # find another qubit to swap with
         candidates = (
             (q, v)
             for (q, v) in input
-            if (q.qchannel is not None and q.qchannel.name in matched_channels)  # assigned to a matched channel
+            if q.qchannel in matched_channels  # assigned to a matched channel
             and has_intersect_tmp_path_ids(epr.tmp_path_ids, v.tmp_path_ids)  # has overlapping tmp_path_ids
         )
         mt1 = self._select_swap_candidate((qubit, epr), candidates)
@@ -227,7 +231,7 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         assert my_new_epr.tmp_path_ids is not None
         if su_path_id not in my_new_epr.tmp_path_ids:
             assert not self.coordinated_decisions
-            log.debug(f"{self.node}: Conflictual parallel swapping in statistical mux -> silently ignore")
+            log.debug("%s: Conflictual parallel swapping in statistical mux -> silently ignore", self.node)
             return True
         return False
 
@@ -669,8 +669,8 @@ class BB84RecvApp(Application[QNode]):
             # check error succeed,Bob's privacy amplification operation
             matrix_row = len(self.cascade_key)
             matrix_col = (1 - self.security) * len(self.cascade_key) - self.bit_leak
-            first_row = [rng.integers(0, 1, dtype=int, endpoint=True) for _ in range(matrix_row)]
-            first_col = [rng.integers(0, 1, dtype=int, endpoint=True) for _ in range(int(matrix_col) - 1)]
+            first_row: list[int] = rng.integers(0, 1, size=matrix_row, endpoint=True).tolist()
+            first_col: list[int] = rng.integers(0, 1, size=max(0, int(matrix_col) - 1), endpoint=True).tolist()
             toeplitz_matrix = pa_generate_toeplitz_matrix(matrix_row, matrix_col, first_row, first_col)
             self.successful_key += list(pa_randomize_key(self.cascade_key, toeplitz_matrix))
             packet = ClassicPacket(
@@ -15,7 +15,6 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import uuid
 from collections import deque
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -53,6 +52,8 @@ class ReservationRequest:
 
 @json_encodable
 class LinkLayerCounters:
+    __slots__ = ("n_etg", "n_attempts", "n_decoh")
+
     @staticmethod
     def aggregate(nodes: Sequence[QNode]) -> "LinkLayerCounters":
         """
@@ -157,6 +158,13 @@ class LinkLayer(Application[QNode]):
         """
         FIFO queue of reservation requests awaiting for memory qubits.
         """
+        self._peer_by_cchannel: dict[ClassicChannel, tuple[QNode, QuantumChannel]] = {}
+        """
+        Cache of neighbor QNode and qchannel reached through each cchannel, populated on first use.
+        """
+
+        self._key_seq = 0
+        """Sequence number for constructing reservation keys."""
 
         self.cnt = LinkLayerCounters()
         """
@@ -247,9 +255,15 @@ class LinkLayer(Application[QNode]):
             1, self.simulator.ts, key=None, src=self.node, dst=neighbor
         )
         log.debug(
-            f"{self.node}: add qchannel {qchannel} with {neighbor} on path {path_id}, "
-            f"link arch {qchannel.link_arch.name}, "
-            f"EPR template {epr_tpl} t_notify_a={t_notify_a} t_notify_b={t_notify_b}"
+            "%s: add qchannel %s with %s on path %s, link arch %s, EPR template %s t_notify_a=%s t_notify_b=%s",
+            self.node,
+            qchannel,
+            neighbor,
+            path_id,
+            qchannel.link_arch.name,
+            epr_tpl,
+            t_notify_a,
+            t_notify_b,
         )
 
         if self.node.timing.is_async():
@@ -262,7 +276,7 @@ class LinkLayer(Application[QNode]):
 
         if n == 0:
             del self.active_channels[key]
-            log.debug(f"{self.node}: remove qchannel {qchannel} with {neighbor} on path {path_id}")
+            log.debug("%s: remove qchannel %s with %s on path %s", self.node, qchannel, neighbor, path_id)
         else:
             self.active_channels[key] = (neighbor, n)
 
@@ -281,11 +295,8 @@ class LinkLayer(Application[QNode]):
             - Qubit reservations are spaced out in time using a fixed ``attempt_rate``.
 
         """
-        qubits = list(self.memory.find(lambda *_: True, qchannel=qchannel))
-        log.debug(f"{self.node}: {qchannel.name} has assigned qubits: {qubits}")
+        qubits = self.memory.find(lambda qb, _: qb.path_id == path_id and qb.state == QubitState.RAW, qchannel=qchannel)
         for qb, data in qubits:
-            if qb.path_id != path_id or qb.state != QubitState.RAW:
-                continue
             assert qb.active is None
             assert data is None, f"{self.node}: qubit {qb} has data {data}"
             self.start_reservation(next_hop, qchannel, qb)
@@ -295,7 +306,7 @@ class LinkLayer(Application[QNode]):
         Start the exchange with neighbor node for reserving a qubit for entanglement
         generation over a specified quantum channel. It performs the following steps:
 
-        1. Construct a random reservation key.
+        1. Construct a unique reservation key.
         2. Mark the qubit as active using the reservation key.
         3. Store reservation metadata in ``self.pending_init_reservation``.
         4. Send a classical message to the next hop to request qubit reservation.
@@ -311,15 +322,16 @@ class LinkLayer(Application[QNode]):
 
         Notes:
             - The key uniquely identifies the reservation context.
-              Key format: ``<node1>_<node2>_[<path_id>]_<local_qubit_addr>``
+              Key format: ``<node>-<seq>``
             - The reservation is communicated via a classical message using the ``RESERVE_QUBIT`` command.
         """
 
-        key = uuid.uuid4().hex
+        self._key_seq += 1
+        key = f"{self.node.name}-{self._key_seq}"
         assert key not in self.pending_init_reservation
         qubit.state, qubit.active = QubitState.ACTIVE, key
         self.pending_init_reservation[key] = (qchannel, next_hop, qubit)
-        log.debug(f"{self.node}: start reservation key={key} dst={next_hop} addr={qubit.addr} path={qubit.path_id}")
+        log.debug("%s: start reservation key=%s dst=%s addr=%d path=%s", self.node, key, next_hop, qubit.addr, qubit.path_id)
 
         msg: ReserveMsg = {"cmd": "RESERVE_QUBIT", "path_id": qubit.path_id, "key": key}
         self.node.send_cpacket(next_hop, ClassicPacket(msg, src=self.node, dest=next_hop))
@@ -332,9 +344,14 @@ class LinkLayer(Application[QNode]):
         2. A ``RESERVE_QUBIT_OK`` response is sent back to confirm the reservation.
         3. If no available qubit is found, the request is enqueued for future retry (FIFO).
         """
-        from_node = cchannel.find_peer(self.node)
-        assert type(from_node) is QNode
-        qchannel = self.node.get_qchannel(from_node)
+        try:
+            from_node, qchannel = self._peer_by_cchannel[cchannel]
+        except KeyError:
+            from_node = cchannel.find_peer(self.node)
+            assert type(from_node) is QNode
+            qchannel = self.node.get_qchannel(from_node)
+            self._peer_by_cchannel[cchannel] = (from_node, qchannel)
+
         req = ReservationRequest(msg["key"], msg["path_id"], cchannel, from_node, qchannel)
         if not self.try_accept_reservation(req):
             self.fifo_reservation_req.append(req)
@@ -363,7 +380,9 @@ class LinkLayer(Application[QNode]):
         if qubit is None:
             return False
 
-        log.debug(f"{self.node}: accept reservation key={req.key} src={req.from_node} addr={qubit.addr} path={qubit.path_id}")
+        log.debug(
+            "%s: accept reservation key=%s src=%s addr=%d path=%s", self.node, req.key, req.from_node, qubit.addr, qubit.path_id
+        )
         qubit.state = QubitState.ACTIVE  # cannot go directly from RAW to RESERVED
         qubit.state, qubit.active = QubitState.RESERVED, req.key
         msg: ReserveMsg = {"cmd": "RESERVE_QUBIT_OK", "path_id": req.path_id, "key": req.key}
@@ -404,16 +423,28 @@ class LinkLayer(Application[QNode]):
         # the EPR would not arrive in time, and therefore is not scheduled.
         if not self.node.timing.is_external(max(t_notify_a, t_notify_b)):
             log.debug(
-                f"{self.node}: skip prepare EPR {epr.name} key={epr.key} dst={epr.dst} attempts={k} "
-                f"notify-times={t_notify_a},{t_notify_b} reason=beyond-external-phase"
+                "%s: skip prepare EPR %s key=%s dst=%s attempts=%d notify-times=%s,%s reason=beyond-external-phase",
+                self.node,
+                epr.name,
+                epr.key,
+                epr.dst,
+                k,
+                t_notify_a,
+                t_notify_b,
             )
             return
 
         # If the network uses ASYNC timing mode or the successful attempt can complete within the current EXTERNAL phase,
         # schedule the EPR arrival on both nodes via LinkArchSuccessEvents.
         log.debug(
-            f"{self.node}: prepare EPR {epr.name} key={epr.key} dst={epr.dst} attempts={k} "
-            f"notify-times={t_notify_a},{t_notify_b}"
+            "%s: prepare EPR %s key=%s dst=%s attempts=%d notify-times=%s,%s",
+            self.node,
+            epr.name,
+            epr.key,
+            epr.dst,
+            k,
+            t_notify_a,
+            t_notify_b,
         )
 
         self.simulator.add_event(LinkArchSuccessEvent(self.node, epr, t=t_notify_a, attempts=k))
@@ -428,7 +459,7 @@ class LinkLayer(Application[QNode]):
         if is_primary:
             self.cnt.increment_n_etg(event.attempts)
 
-        log.debug(f"{self.node}: got half-EPR {epr.name} key={epr.key} {'dst' if is_primary else 'src'}={neighbor}")
+        log.debug("%s: got half-EPR %s key=%s %s=%s", self.node, epr.name, epr.key, "dst" if is_primary else "src", neighbor)
         assert epr.decohere_time > self.simulator.tc
 
         qubit = self.memory.write(epr.key, epr)
@@ -442,7 +473,9 @@ class LinkLayer(Application[QNode]):
         is_decoh = type(event) is QubitDecoheredEvent
 
         qubit = event.qubit
-        log.debug(f"{self.node}: qubit {'decohered' if is_decoh else 'released'} addr={qubit.addr} old-key={qubit.active}")
+        log.debug(
+            "%s: qubit %s addr=%d old-key=%s", self.node, "decohered" if is_decoh else "released", qubit.addr, qubit.active
+        )
         qubit.state, qubit.active = QubitState.RAW, None
 
         assert qubit.qchannel is not None
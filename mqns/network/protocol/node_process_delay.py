@@ -15,8 +15,10 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from typing import override
+
 from mqns.entity.node import Application, Node
-from mqns.simulator import Event
+from mqns.simulator import Event, Time
 
 
 class NodeProcessDelayApp(Application[Node]):
@@ -37,6 +39,12 @@ class NodeProcessDelayApp(Application[Node]):
         self.delay_event_list = delay_event_list
         self.wait_rehandle_event_list = []
 
+    @override
+    def install(self, node: Node):
+        super().install(node)
+        self._delay_time: Time = self.simulator.time(sec=self.delay)
+        """Processing delay converted to simulator time once."""
+
     def check_in_delay_event_list(self, event) -> bool:
         if self.delay_event_list is None:
             return True
@@ -54,7 +62,7 @@ class NodeProcessDelayApp(Application[Node]):
         # add to list
         self.wait_rehandle_event_list.append(event)
         # get the delay time
-        t = self.simulator.tc + self.delay
+        t = self.simulator.tc + self._delay_time
         # reset event's occur time
         event.t = t
         self.simulator.add_event(event)
@@ -27,6 +27,8 @@ from mqns.utils import json_encodable, log
 class ReactiveRoutingControllerCounters:
     """Counters related to ``ReactiveRoutingController``."""
 
+    __slots__ = ("n_ls", "n_decision")
+
     def __init__(self):
         self.n_ls = 0
         """How many link-state message arrived."""
@@ -46,9 +46,10 @@ class ReactiveForwarder(Forwarder):
         Instruct LinkLayer to start generating EPRs on ALL qchannels.
         This may be called from install() or at the first EXTERNAL phase (for better coordination).
         """
+        tc = self.simulator.tc
         for ch in self.node.qchannels:
             if self.node == ch.node_list[0]:  # self is the EPR initiator node for this channel
-                log.debug(f"{self.node}: activate qchannel {ch.name}")
+                log.debug("%s: activate qchannel %s", self.node, ch.name)
                 self.simulator.add_event(
                     ManageActiveChannels(
                         self.node,
@@ -56,7 +57,7 @@ class ReactiveForwarder(Forwarder):
                         ch,
                         path_id=None,
                         start=True,
-                        t=self.simulator.tc,
+                        t=tc,
                     )
                 )
 
@@ -71,8 +72,8 @@ class ReactiveForwarder(Forwarder):
            and wait for routing instructions.
         """
         if event.phase == TimingPhase.ROUTING:
-            log.debug(f"{self.node}: there are {len(self.waiting_etg)} etg qubits to process")
-            log.debug(f"{self.node}: send link_state for {len(self.waiting_etg)} etg qubits")
+            log.debug("%s: there are %s etg qubits to process", self.node, len(self.waiting_etg))
+            log.debug("%s: send link_state for %s etg qubits", self.node, len(self.waiting_etg))
             self.send_link_state()
         else:
             super().handle_sync_phase(event)
@@ -94,7 +95,7 @@ class ReactiveForwarder(Forwarder):
             link_states.append({"node": event.node.name, "neighbor": event.neighbor.name, "qubit": event.qubit.addr})
 
         if len(link_states) == 0:
-            log.debug(f"{self.node}: no link_state to send")
+            log.debug("%s: no link_state to send", self.node)
             return
 
         msg: LinkStateMsg = {
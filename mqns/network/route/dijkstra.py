@@ -15,7 +15,7 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, override
+from typing import override
 
 import numpy as np
 from scipy.sparse.csgraph import dijkstra
@@ -30,6 +30,7 @@ class DijkstraRouteAlgorithm[N: Node, C: BaseChannel](RouteAlgorithm[N, C]):
     Dijkstra algorithm.
 
     This is implemented with SciPy's csgraph Dijkstra on a CSR adjacency.
+    Paths are reconstructed from the predecessor matrix upon first query and then memoized in ``route_table``.
     """
 
     @override
@@ -42,6 +43,10 @@ class DijkstraRouteAlgorithm[N: Node, C: BaseChannel](RouteAlgorithm[N, C]):
         """
         super().__init__(name, metric_func)
         self.route_table: dict[N, dict[N, tuple[float, list[N]]]] = {}
+        self._nodes: list[N] = []
+        self._node_index: dict[N, int] = {}
+        self._dist = np.empty((0, 0), dtype=np.float64)
+        self._preds = np.empty((0, 0), dtype=np.int32)
 
     @override
     def build(self, nodes: list[N], channels: list[C]):
@@ -49,62 +54,58 @@ class DijkstraRouteAlgorithm[N: Node, C: BaseChannel](RouteAlgorithm[N, C]):
         csr_adj = make_csr(nodes, channels, self.metric_func)
 
         # unweighted=True -> hop count; directed=False for undirected topologies
-        dist, preds = dijkstra(
+        self._dist, self._preds = dijkstra(
             csr_adj,
             directed=False,
             unweighted=self.unweighted,
             return_predecessors=True,
         )
+        self._nodes = list(nodes)
+        self._node_index = {nd: i for i, nd in enumerate(self._nodes)}
+        self.route_table.clear()
 
-        # Reconstruct path helper
-        def _reconstruct_path(src_idx: int, dst_idx: int) -> list[N]:
+    def _lookup(self, src: N, dst: N) -> tuple[float, list[N]] | None:
+        """
+        Retrieve route table entry, reconstructing it from the predecessor matrix if necessary.
+        Path in the entry is stored from ``dst`` to ``src``.
+        """
+        dest_entry = self.route_table.get(src)
+        if dest_entry is not None and (entry := dest_entry.get(dst)) is not None:
+            return entry
+
+        src_idx = self._node_index.get(src)
+        dst_idx = self._node_index.get(dst)
+        if src_idx is None or dst_idx is None:
+            return None
+        if dest_entry is None:
+            dest_entry = self.route_table[src] = {}
+
+        hop = self._dist[src_idx, dst_idx]
+        if src_idx == dst_idx:
+            # Source to itself
+            entry = (0.0, [dst])
+        elif np.isinf(hop):  # Unreachable
+            entry = (np.inf, [dst])
+        else:
             # Backtrack from dst to src using predecessors
             path_idx: list[int] = []
             u = dst_idx
             while u not in (-9999, src_idx):
                 path_idx.append(u)
-                u = preds[src_idx, u]
+                u = self._preds[src_idx, u]
             path_idx.append(src_idx)
-            return [nodes[i] for i in path_idx]
-
-        self.route_table.clear()
+            entry = (hop.item(), [self._nodes[i] for i in path_idx])
 
-        # For each source node, create the per-destination entry
-        for src_idx, src_node in enumerate(nodes):
-            dest_entry: dict[N, Any] = {}
-
-            for dst_idx, dst_node in enumerate(nodes):
-                if src_idx == dst_idx:
-                    # Source to itself
-                    dest_entry[dst_node] = [0.0, [dst_node]]
-                    continue
-
-                hop = dist[src_idx, dst_idx]
-                if np.isinf(hop):  # Unreachable
-                    dest_entry[dst_node] = [np.inf, [dst_node]]
-                else:
-                    path_nodes = _reconstruct_path(src_idx, dst_idx)
-                    dest_entry[dst_node] = [hop, path_nodes]
-
-            self.route_table[src_node] = dest_entry
+        dest_entry[dst] = entry
+        return entry
 
     @override
     def query(self, src: N, dst: N) -> list[RouteQueryResult]:
-        ls = self.route_table.get(src, None)
-        if ls is None:
-            return []
-        le = ls.get(dst, None)
+        le = self._lookup(src, dst)
         if le is None:
             return []
-        try:
-            metric, path = le
-            path = path.copy()
-            path.reverse()
-            if len(path) <= 1 or np.isinf(metric):  # unreachable
-                next_hop = None
-                return []
-            else:
-                next_hop = path[1]
-                return [RouteQueryResult(metric, next_hop, path)]
-        except Exception:
+        metric, path = le
+        if len(path) <= 1 or np.isinf(metric):  # unreachable
             return []
+        path = path[::-1]
+        return [RouteQueryResult(metric, path[1], path)]
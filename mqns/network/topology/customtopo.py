@@ -137,15 +137,16 @@ class CustomTopology(Topology):
             self._save_node(qn)
 
         # Create quantum channels and assign memories with proper capacity
+        qn_index = {qn.name: i for i, qn in enumerate(qnl)}
         for ch in self.topo["qchannels"]:
             node1, node2 = ch["node1"], ch["node2"]
             link = QuantumChannel(name=f"q_{node1},{node2}", **ch["parameters"])
             qcl.append(link)
 
-            # Attach quantum channel to nodes
-            for qn in qnl:
-                if qn.name in (node1, node2):
-                    qn.add_qchannel(link)
+            # Attach quantum channel to nodes, in the same order as they appear in qnodes list
+            # Unknown node names are skipped.
+            for i in sorted(qn_index[name] for name in {node1, node2} if name in qn_index):
+                qnl[i].add_qchannel(link)
 
             link.assign_memory_qubits(
                 capacity={
@@ -59,7 +59,7 @@ class Topology(ABC):
     def __init__(self, nodes_number: int, **kwargs: Unpack[TopologyInitKwargs]):
         """Args:
         nodes_number: the number of Qnodes
-        nodes_apps: apps will be installed to all nodes
+        nodes_apps: prototype apps; each node receives a deep copy, so they are constructed only once
         qchannel_args: default quantum channel arguments
         cchannel_args: default channel channel arguments
         memory_args: default quantum memory arguments
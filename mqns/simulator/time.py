@@ -26,6 +26,8 @@ class Time:
     Timestamp or duration used in the simulator.
     """
 
+    __slots__ = ("time_slot", "accuracy")
+
     SENTINEL: "Time"
     """Invalid Time instance as placeholder."""
 
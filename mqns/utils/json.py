@@ -1,3 +1,5 @@
+from array import array
+from collections.abc import Iterator
 from typing import Any, cast
 
 import numpy as np
@@ -17,6 +19,19 @@ def json_encodable[T: type](cls: T) -> T:
     return cls
 
 
+def _iter_attributes(obj: Any) -> Iterator[tuple[str, Any]]:
+    """
+    Iterate over instance attributes, stored either in ``__dict__`` or in ``__slots__``.
+    """
+    if hasattr(obj, "__dict__"):
+        yield from cast(dict[str, Any], vars(obj)).items()
+    for typ in reversed(type(obj).__mro__):
+        slots = typ.__dict__.get("__slots__", ())
+        for mem in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(obj, mem):
+                yield mem, getattr(obj, mem)
+
+
 def json_default(obj: Any) -> Any:
     """
     Custom JSON encoder, passed as ``json.dumps(default=json_default)``.
@@ -24,18 +39,19 @@ def json_default(obj: Any) -> Any:
     It accepts these types:
 
     * ``np.ndarray``
+    * ``array.array``
     * class decorated with ``json_encodable``
     """
     typ = type(obj)
 
-    if typ is np.ndarray:
+    if typ is np.ndarray or typ is array:
         return obj.tolist()
 
     if getattr(typ, _MARKER_ATTRIBUTE, None) is not _MARKER_SENTINEL:
         raise TypeError(f"cannot encode {typ}")
 
     d = {}
-    for mem, val in cast(dict[str, Any], vars(obj)).items():
+    for mem, val in _iter_attributes(obj):
         if mem[:1] != "_":
             d[mem] = val
     for mem in dir(typ):
@@ -76,3 +76,19 @@ def test_cchannel_uniform_delay():
 
     s = Simulator(0, 10, accuracy=1000, install_to=(n1, n2))
     s.run()
+
+
+def test_packet_get_decodes_once():
+    n1, n2 = Node("n1"), Node("n2")
+    msg = {"cmd": "PING", "path_id": 1}
+
+    packet = ClassicPacket(msg, src=n1, dest=n2)
+    assert packet.is_json
+    decoded = packet.get()
+    assert decoded == msg
+    assert decoded is not msg
+    assert packet.get() is decoded
+
+    packet = ClassicPacket("ping", src=n1, dest=n2)
+    assert not packet.is_json
+    assert packet.get() == "ping"
@@ -154,3 +154,68 @@ def test_realistic_error(LA: type[LinkArch], w_or_probv: float | tuple[float, fl
         assert epr.w == pytest.approx(w_or_probv, abs=1e-6)
     elif type(epr) is MixedStateEntanglement:
         assert epr.probv == pytest.approx(w_or_probv, abs=1e-6)
+
+
+def test_set_memoized():
+    ch = FakeQuantumChannel(50.0, transfer_error_rate=0.001)
+    t_cohere = Time.from_sec(0.100, accuracy=ACCURACY)
+    store_decay = parse_time_decay(None, t_cohere)
+    link_arch = LinkArchDimBk()
+
+    def set_link_arch(t0: Time, **kwargs):
+        link_arch.set(
+            ch=ch,
+            eta_s=1,
+            eta_d=1,
+            reset_time=0,
+            tau_0=0.000001,
+            epr_type=WernerStateEntanglement,
+            t0=t0,
+            store_decays=(store_decay, store_decay),
+            bsa_error={"p_error": 0.01},
+            **kwargs,
+        )
+
+    set_link_arch(Time(0, accuracy=ACCURACY))
+    success_prob, make_epr = link_arch.success_prob, link_arch._make_epr
+
+    # same parameters at a later time: previous computation is reused
+    set_link_arch(Time(5, accuracy=ACCURACY))
+    assert link_arch._make_epr is make_epr
+
+    # changed parameters: recomputed
+    set_link_arch(Time(5, accuracy=ACCURACY), init_fidelity=0.9)
+    assert link_arch._make_epr is not make_epr
+    assert link_arch.success_prob == success_prob
+
+    ch.length = 20.0
+    set_link_arch(Time(5, accuracy=ACCURACY), init_fidelity=0.9)
+    assert link_arch.success_prob > success_prob
+
+
+def test_set_memoized_transfer_error():
+    ch = FakeQuantumChannel(50.0, transfer_error_rate=0.001)
+    t_cohere = Time.from_sec(0.100, accuracy=ACCURACY)
+    link_arch = LinkArchDimBk()
+
+    def set_link_arch():
+        link_arch.set(
+            ch=ch,
+            eta_s=1,
+            eta_d=1,
+            reset_time=0,
+            tau_0=0.000001,
+            epr_type=WernerStateEntanglement,
+            t0=Time(0, accuracy=ACCURACY),
+            bsa_error={"p_error": 0},
+        )
+
+    set_link_arch()
+    epr, _, _ = make_epr(link_arch, t_cohere)
+    fidelity = epr.fidelity
+
+    # transfer error model changed in place: recomputed
+    ch.transfer_error.set(rate=0.01, length=0)
+    set_link_arch()
+    epr, _, _ = make_epr(link_arch, t_cohere)
+    assert epr.fidelity < fidelity
@@ -189,6 +189,22 @@ def test_memory_sync_qubit_limited():
     assert mem.read("q6", must=True)[0].addr == 3
 
 
+def test_memory_read_by_name_after_replace():
+    scenario = TwoNodes(capacity=2)
+    mem = scenario.m1
+
+    qubit = mem.write(None, scenario.make_epr("epr1"))
+    mem.write(qubit.addr, scenario.make_epr("epr2"), replace=True)
+    assert mem.read("epr1") is None
+    assert mem.read("epr2", must=True)[0] is qubit
+
+    mem.read("epr2", remove=True)
+    assert mem.read("epr2") is None
+    mem.write(None, scenario.make_epr("epr3"))
+    mem.clear()
+    assert mem.read("epr3") is None
+
+
 def test_memory_async_qubit():
     class MemoryReadResponseApp(Application[QNode]):
         def __init__(self):
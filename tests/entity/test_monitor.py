@@ -145,3 +145,29 @@ def test_monitor_full_continuous():
     assert count_by_event_name["RecvQubitPacket"] > 0
     assert count_by_event_name["start watch event"] == 1
     assert count_by_event_name["period watch event(1)"] == 10
+
+
+def test_monitor_stop_watch_event():
+    simulator = Simulator(0, 10, accuracy=1000)
+    sp, rp = build_network(simulator)
+
+    m = Monitor("m")
+
+    def recv_count(s, n, e):
+        if rp.count >= 5:
+            m.stop_watch_event()
+        return rp.count
+
+    m.add_attribution("recv_count", recv_count)
+    m.at_event(RecvQubitPacket)
+    m.install(simulator)
+
+    simulator.run()
+
+    data = m.get_data()
+    print(data)
+
+    assert rp.count > 5
+    assert len(data) == 5
+    assert data.at[4, "recv_count"] == 5
+    assert simulator.watchers is None
@@ -23,6 +23,14 @@ def test_dijkstra():
     assert len(r14) == 1
     assert r14[0] == (3, n2, [n1, n2, n3, n4])
 
+    # memoized route is returned as a copy that does not alter the table
+    r14[0].route.clear()
+    assert net.query_route(n1, n4)[0] == (3, n2, [n1, n2, n3, n4])
+
+    r41 = net.query_route(n4, n1)
+    assert len(r41) == 1
+    assert r41[0] == (3, n3, [n4, n3, n2, n1])
+
 
 def test_yen():
     """
@@ -1,4 +1,5 @@
 import json
+from array import array
 
 import numpy as np
 import pytest
@@ -9,6 +10,7 @@ from mqns.utils import json_default, json_encodable
 class DataClass:
     def __init__(self):
         self.included_attribute = np.array([1], dtype=np.int16)
+        self.included_array = array("d", [0.5])
         self._excluded_attribute = 2
 
     @property
@@ -25,6 +27,20 @@ class EncodableClass(DataClass):
     pass
 
 
+@json_encodable
+class SlottedClass:
+    __slots__ = ("included_attribute", "_excluded_attribute")
+
+    def __init__(self):
+        self.included_attribute = 1
+        self._excluded_attribute = 2
+
+
+def test_json_default_slots():
+    wire = json.dumps(SlottedClass(), default=json_default, sort_keys=True)
+    assert wire == '{"included_attribute": 1}'
+
+
 def test_json_default():
     with pytest.raises(TypeError):
         json.dumps(EncodableClass())
@@ -33,4 +49,4 @@ def test_json_default():
         json.dumps(DataClass(), default=json_default)
 
     wire = json.dumps(EncodableClass(), default=json_default, sort_keys=True)
-    assert wire == '{"included_attribute": [1], "included_property": 3}'
+    assert wire == '{"included_array": [0.5], "included_attribute": [1], "included_property": 3}'